@@ -312,6 +312,7 @@ def setup_run(
 def run(
     config: Configuration,
     system_type: Union[Type[TLMSystem], Type[QESystem]] = QESystem,
+    callbacks: Optional[List[pl.Callback]] = None,
 ) -> TrainRunInfo:
     """Instantiate the system according to the configuration and train it.
 
@@ -320,6 +321,8 @@ def run(
     Args:
         config: generic training options.
         system_type: class of system being used.
+        callbacks: extra PyTorch Lightning callbacks to pass to the trainer (e.g.,
+            a hyper-parameter search pruning callback).
 
     Return:
         an object with training information.
@@ -376,7 +379,7 @@ def run(
         logger=tracking_logger or False,
         checkpoint_callback=checkpoint_callback,
         early_stop_callback=early_stop_callback,
-        callbacks=[best_metrics_callback],
+        callbacks=[best_metrics_callback, *(callbacks or [])],
         gpus=config.trainer.gpus,
         #
         max_epochs=config.trainer.epochs,
@@ -137,7 +137,6 @@ def file_to_configuration(config_file: Union[str, Path]) -> Dict:
     Return:
         Dictionary of the configuration imported from config file.
     """
-    _reset_hydra()
     return arguments_to_configuration({'CONFIG_FILE': config_file})
 
 
@@ -16,6 +16,7 @@
 #
 import numpy as np
 import pytest
+import pytorch_lightning as pl
 
 from conftest import check_computation
 from kiwi import constants as const
@@ -171,5 +172,25 @@ def test_api(tmp_path, output_target_config, train_config, data_config, atol):
     assert len(predictions.target_tags_labels) == len(target)
 
 
+def test_extra_callbacks(tmp_path, output_target_config, train_config, data_config):
+    class ValidationCounter(pl.Callback):
+        def __init__(self):
+            self.validations = 0
+
+        def on_validation_end(self, trainer, pl_module):
+            self.validations += 1
+
+    train_config['run']['output_dir'] = tmp_path
+    train_config['data'] = data_config
+    train_config['system'] = output_target_config
+    counter = ValidationCounter()
+
+    train_info = train.run(train.Configuration(**train_config), callbacks=[counter])
+
+    assert counter.validations > 0
+    # The built-in BestMetricsInfo callback must still be in place
+    assert train_info.best_metrics
+
+
 if __name__ == '__main__':  # pragma: no cover
     pytest.main([__file__])  # pragma: no cover